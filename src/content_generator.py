@@ -5,8 +5,13 @@ LLM을 사용하여 Git 커밋 정보를 바탕으로 블로그 내용을 생성
 기술 블로그 포스트의 내용을 자동으로 생성합니다.
 """
 
+import hashlib
+import io
+import json
 import logging
 import os
+import sqlite3
+import time
 from typing import List, Dict, Optional
 from datetime import datetime
 import openai
@@ -20,26 +25,172 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 매 요청마다 동일한 지시문은 메시지 맨 앞에 고정해 두어야
+# 프롬프트 캐시(prefix cache)가 재사용됩니다. 요청별로 달라지는
+# 커밋 정보는 마지막 user 메시지에만 담습니다.
+SYSTEM_PROMPT = """당신은 경험 많은 개발자이자 기술 블로그 작가입니다. Git 커밋 정보를 바탕으로 유익하고 읽기 쉬운 기술 블로그 포스트를 작성합니다.
+
+사용자가 전달하는 Git 커밋 정보를 바탕으로 기술 블로그 포스트의 제목과 본문을 작성해주세요.
+
+제목은 간결하고 명확해야 하며, 개발자가 작성한 것처럼 자연스러워야 합니다.
+제목은 한 줄로 작성하고 따옴표나 특수문자는 사용하지 마세요.
+
+본문은 다음 형식으로 작성해주세요:
+
+## ✨ 들어가며
+오늘 어떤 기능을 개발했는지, 혹은 어떤 버그를 수정했는지 간략하게 소개하는 문단입니다.
+
+## 📝 주요 변경 사항
+- (관련 Git 커밋 해시) 변경된 핵심 로직이나 기능에 대해 서술합니다.
+- 코드 블록을 사용해 실제 코드 변경점을 보여줍니다.
+
+## 💡 구현 과정 및 배운 점
+개발 과정에서 겪었던 어려움, 해결 방법, 새롭게 알게 된 점 등을 자유롭게 서술합니다.
+
+## ✅ 마무리
+다음 계획이나 소감을 짧게 남기는 문단입니다.
+
+자연스럽고 읽기 쉬운 한국어로 작성해주세요. 기술적이면서도 친근한 톤을 유지해주세요.
+
+결과는 반드시 {"title": "제목", "content": "Markdown 본문"} 형태의 JSON 객체로만 출력해주세요.
+"""
+
+# JSON 모드(response_format=json_object)를 지원하는 모델이어야 합니다
+DEFAULT_MODEL = "gpt-4o"
+
+# 프롬프트가 바뀌면 캐시 키도 바뀌도록 프롬프트 내용으로 버전을 정합니다
+PROMPT_VERSION = hashlib.sha256(SYSTEM_PROMPT.encode('utf-8')).hexdigest()[:12]
+
+# LLM에 전달할 최대 커밋 수와 커밋 정보의 최대 길이
+_MAX_PROMPT_COMMITS = 30
+_MAX_SUMMARY_CHARS = 8000
+
+# 우선적으로 포함할 Conventional Commits 타입
+_PRIORITY_COMMIT_PREFIXES = ('feat', 'fix')
+
+# 커밋별 변경 파일 목록을 그대로 나열할 최대 개수
+_MAX_LISTED_FILES = 20
+
+_CHANGE_TYPE_TEXT = {
+    'A': '추가',
+    'M': '수정',
+    'D': '삭제'
+}
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "blog_auto", "llm_cache.db")
+
 
 class ContentGenerator:
     """LLM을 사용하여 블로그 내용을 생성하는 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
+    def __init__(self, api_key: Optional[str] = None, model: str = DEFAULT_MODEL,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         """
         ContentGenerator 초기화
         
         Args:
             api_key: OpenAI API 키 (None인 경우 환경변수에서 로드)
             model: 사용할 OpenAI 모델명
+            cache_path: 생성 결과 캐시 DB 경로 (None인 경우 캐시 사용 안 함)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.model = model or os.getenv("OPENAI_MODEL", "gpt-4")
+        self.model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
         
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다. 환경변수 OPENAI_API_KEY를 설정하거나 직접 전달하세요.")
         
-        openai.api_key = self.api_key
-        logger.info(f"ContentGenerator 초기화 완료 (모델: {self.model})")
+        # 요청마다 클라이언트를 새로 만들지 않고 연결 풀을 재사용
+        self._client = openai.OpenAI(api_key=self.api_key)
+        self._async_client = None
+        self._cache = self._open_cache(cache_path) if cache_path else None
+        logger.info("ContentGenerator 초기화 완료 (모델: %s)", self.model)
+    
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """
+        생성 결과를 저장할 SQLite 캐시를 엽니다
+        
+        Args:
+            cache_path: 캐시 DB 파일 경로
+            
+        Returns:
+            캐시 DB 연결 (열 수 없는 경우 None)
+        """
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            
+            conn = sqlite3.connect(cache_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, title TEXT, content TEXT, ts REAL)"
+            )
+            conn.commit()
+            return conn
+            
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("캐시를 열 수 없어 캐시 없이 진행합니다: %s", e)
+            return None
+    
+    def _cache_key(self, commits: List[CommitInfo], include_file_changes: bool) -> str:
+        """
+        커밋 해시 집합, 모델, 프롬프트 버전으로 캐시 키를 만듭니다
+        
+        Args:
+            commits: 커밋 정보 리스트
+            include_file_changes: 파일 변경 정보 포함 여부
+            
+        Returns:
+            캐시 키
+        """
+        hashes = ",".join(sorted(commit.hash for commit in commits))
+        raw = f"{self.model}|{PROMPT_VERSION}|{int(include_file_changes)}|{hashes}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        캐시에서 생성 결과를 조회합니다
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            캐시된 제목과 본문 (없는 경우 None)
+        """
+        if self._cache is None:
+            return None
+        
+        try:
+            row = self._cache.execute(
+                "SELECT title, content FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("캐시 조회 중 오류 발생: %s", e)
+            return None
+        
+        if row is None:
+            return None
+        return {'title': row[0], 'content': row[1]}
+    
+    def _cache_put(self, key: str, post: Dict[str, str]) -> None:
+        """
+        생성 결과를 캐시에 저장합니다
+        
+        Args:
+            key: 캐시 키
+            post: 생성된 제목과 본문
+        """
+        if self._cache is None:
+            return
+        
+        try:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, title, content, ts) VALUES (?, ?, ?, ?)",
+                (key, post['title'], post['content'], time.time())
+            )
+            self._cache.commit()
+        except sqlite3.Error as e:
+            logger.warning("캐시 저장 중 오류 발생: %s", e)
     
     def generate_blog_content(self, commits: List[CommitInfo], file_changes: List[FileChange] = None) -> Dict[str, str]:
         """
@@ -53,33 +204,123 @@ class ContentGenerator:
             생성된 블로그 내용 (제목, 본문 등)
         """
         try:
-            # 커밋 정보를 텍스트로 변환
-            commit_summary = self._format_commits_for_llm(commits)
+            # 같은 커밋 집합으로 이미 생성한 결과가 있으면 재사용
+            cache_key = self._cache_key(commits, bool(file_changes))
+            post = self._cache_get(cache_key)
+            if post is not None:
+                logger.info("캐시된 블로그 내용을 사용합니다")
+                return self._build_result(post)
             
-            # 파일 변경 정보가 있으면 추가
-            if file_changes:
-                file_summary = self._format_file_changes_for_llm(file_changes)
-                commit_summary += f"\n\n파일 변경 상세:\n{file_summary}"
+            # 블로그 제목과 본문을 한 번의 요청으로 생성
+            commit_summary = self._build_commit_summary(commits, file_changes)
+            post = self._generate_post(commit_summary)
+            if 'error' not in post:
+                self._cache_put(cache_key, post)
             
-            # 블로그 제목 생성
-            title = self._generate_title(commits)
+            return self._build_result(post)
             
-            # 블로그 본문 생성
-            content = self._generate_content(commit_summary)
+        except Exception as e:
+            logger.error("블로그 내용 생성 중 오류 발생: %s", e)
+            return self._error_result(e)
+    
+    async def agenerate_blog_content(self, commits: List[CommitInfo], file_changes: List[FileChange] = None) -> Dict[str, str]:
+        """
+        generate_blog_content의 비동기 버전입니다
+        
+        여러 기간의 포스트를 asyncio.gather로 동시에 생성할 때 사용합니다.
+        
+        Args:
+            commits: 커밋 정보 리스트
+            file_changes: 파일 변경 정보 리스트 (선택사항)
+            
+        Returns:
+            생성된 블로그 내용 (제목, 본문 등)
+        """
+        try:
+            cache_key = self._cache_key(commits, bool(file_changes))
+            post = self._cache_get(cache_key)
+            if post is not None:
+                logger.info("캐시된 블로그 내용을 사용합니다")
+                return self._build_result(post)
+            
+            commit_summary = self._build_commit_summary(commits, file_changes)
+            post = await self._agenerate_post(commit_summary)
+            if 'error' not in post:
+                self._cache_put(cache_key, post)
             
-            return {
-                'title': title,
-                'content': content,
-                'generated_at': datetime.now().isoformat()
-            }
+            return self._build_result(post)
             
         except Exception as e:
-            logger.error(f"블로그 내용 생성 중 오류 발생: {e}")
-            return {
-                'title': '오늘의 개발 일지',
-                'content': '내용 생성 중 오류가 발생했습니다.',
-                'error': str(e)
-            }
+            logger.error("블로그 내용 생성 중 오류 발생: %s", e)
+            return self._error_result(e)
+    
+    async def aclose(self) -> None:
+        """비동기 클라이언트를 닫습니다 (asyncio 이벤트 루프가 끝나기 전에 호출)"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+    
+    def _build_commit_summary(self, commits: List[CommitInfo], file_changes: List[FileChange] = None) -> str:
+        """
+        LLM에 전달할 커밋 및 파일 변경 정보 텍스트를 만듭니다
+        
+        Args:
+            commits: 커밋 정보 리스트
+            file_changes: 파일 변경 정보 리스트 (선택사항)
+            
+        Returns:
+            포맷팅된 커밋 정보
+        """
+        # 커밋 정보를 텍스트로 변환 (중요한 커밋만 추려서)
+        commit_summary = self._format_commits_for_llm(self._select_commits(commits))
+        
+        # 파일 변경 정보가 있으면 추가
+        if file_changes:
+            file_summary = self._format_file_changes_for_llm(file_changes)
+            commit_summary += f"\n\n파일 변경 상세:\n{file_summary}"
+        
+        # 출력 토큰이 제한되어 있으므로 입력도 일정 길이에서 자름
+        return commit_summary[:_MAX_SUMMARY_CHARS]
+    
+    def _select_commits(self, commits: List[CommitInfo]) -> List[CommitInfo]:
+        """
+        LLM에 전달할 커밋을 최대 _MAX_PROMPT_COMMITS개까지 고릅니다
+        
+        feat/fix 커밋을 우선하고, 그 다음은 변경 라인 수가 많은 순으로 고른 뒤
+        원래 순서(최신순)를 유지해서 반환합니다.
+        
+        Args:
+            commits: 커밋 정보 리스트
+            
+        Returns:
+            선택된 커밋 정보 리스트
+        """
+        if len(commits) <= _MAX_PROMPT_COMMITS:
+            return commits
+        
+        def priority(index: int):
+            commit = commits[index]
+            is_key_change = commit.message.lower().startswith(_PRIORITY_COMMIT_PREFIXES)
+            return (is_key_change, abs(commit.additions) + abs(commit.deletions))
+        
+        selected = sorted(range(len(commits)), key=priority, reverse=True)[:_MAX_PROMPT_COMMITS]
+        return [commits[index] for index in sorted(selected)]
+    
+    def _build_result(self, post: Dict[str, str]) -> Dict[str, str]:
+        """생성된 제목과 본문에 생성 시각을 붙여 반환합니다"""
+        return {
+            'title': post['title'],
+            'content': post['content'],
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    def _error_result(self, error: Exception) -> Dict[str, str]:
+        """내용 생성 실패 시 반환할 기본 결과를 만듭니다"""
+        return {
+            'title': '오늘의 개발 일지',
+            'content': '내용 생성 중 오류가 발생했습니다.',
+            'error': str(error)
+        }
     
     def _format_commits_for_llm(self, commits: List[CommitInfo]) -> str:
         """
@@ -94,19 +335,25 @@ class ContentGenerator:
         if not commits:
             return "최근 커밋이 없습니다."
         
-        formatted_commits = []
-        for commit in commits:
-            formatted_commit = f"""
-커밋: {commit.hash}
-작성자: {commit.author}
-날짜: {commit.date.strftime('%Y-%m-%d %H:%M:%S')}
-메시지: {commit.message}
-변경된 파일: {', '.join(commit.files_changed)}
-추가된 라인: {commit.additions}, 삭제된 라인: {commit.deletions}
-"""
-            formatted_commits.append(formatted_commit)
+        buf = io.StringIO()
+        for i, commit in enumerate(commits):
+            if i:
+                buf.write("\n")
+            
+            # 변경 파일이 많으면 목록 대신 개수만 표시
+            if len(commit.files_changed) > _MAX_LISTED_FILES:
+                files_text = f"{len(commit.files_changed)}개 파일"
+            else:
+                files_text = ', '.join(commit.files_changed)
+            
+            buf.write(f"\n커밋: {commit.hash}\n")
+            buf.write(f"작성자: {commit.author}\n")
+            buf.write(f"날짜: {commit.date.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            buf.write(f"메시지: {commit.message}\n")
+            buf.write(f"변경된 파일: {files_text}\n")
+            buf.write(f"추가된 라인: {commit.additions}, 삭제된 라인: {commit.deletions}\n")
         
-        return "\n".join(formatted_commits)
+        return buf.getvalue()
     
     def _format_file_changes_for_llm(self, file_changes: List[FileChange]) -> str:
         """
@@ -121,123 +368,168 @@ class ContentGenerator:
         if not file_changes:
             return ""
         
-        formatted_changes = []
-        for change in file_changes:
-            change_type_text = {
-                'A': '추가',
-                'M': '수정',
-                'D': '삭제'
-            }.get(change.change_type, change.change_type)
-            
-            formatted_change = f"""
-파일: {change.file_path}
-변경 타입: {change_type_text}
-추가된 라인: {change.additions}, 삭제된 라인: {change.deletions}
-"""
-            formatted_changes.append(formatted_change)
+        buf = io.StringIO()
+        for i, change in enumerate(file_changes):
+            if i:
+                buf.write("\n")
+            
+            change_type_text = _CHANGE_TYPE_TEXT.get(change.change_type, change.change_type)
+            
+            buf.write(f"\n파일: {change.file_path}\n")
+            buf.write(f"변경 타입: {change_type_text}\n")
+            buf.write(f"추가된 라인: {change.additions}, 삭제된 라인: {change.deletions}\n")
         
-        return "\n".join(formatted_changes)
+        return buf.getvalue()
     
-    def _generate_title(self, commits: List[CommitInfo]) -> str:
+    def _generate_post(self, commit_summary: str) -> Dict[str, str]:
         """
-        커밋 정보를 바탕으로 블로그 제목을 생성합니다
+        커밋 정보를 바탕으로 블로그 제목과 본문을 한 번의 요청으로 생성합니다
         
         Args:
-            commits: 커밋 정보 리스트
+            commit_summary: 포맷팅된 커밋 정보
             
         Returns:
-            생성된 제목
+            생성된 제목과 본문 ('title', 'content', 실패 시 'error')
         """
-        if not commits:
-            return "오늘의 개발 일지"
-        
-        # 커밋 메시지들을 분석하여 제목 생성
-        commit_messages = [commit.message for commit in commits]
-        messages_text = "\n".join(commit_messages)
-        
-        prompt = f"""
-다음 Git 커밋 메시지들을 분석하여 기술 블로그 포스트의 제목을 생성해주세요.
-제목은 간결하고 명확해야 하며, 개발자가 작성한 것처럼 자연스러워야 합니다.
-
-커밋 메시지들:
-{messages_text}
-
-제목만 한 줄로 출력해주세요. 따옴표나 특수문자는 사용하지 마세요.
-"""
+        try:
+            response = self._client.chat.completions.create(**self._completion_params(commit_summary))
+            return self._parse_post(response, commit_summary)
+            
+        except Exception as e:
+            logger.error("제목 및 본문 생성 중 오류 발생: %s", e)
+            return self._fallback_post(commit_summary, e)
+    
+    async def _agenerate_post(self, commit_summary: str) -> Dict[str, str]:
+        """
+        _generate_post의 비동기 버전입니다
         
+        Args:
+            commit_summary: 포맷팅된 커밋 정보
+            
+        Returns:
+            생성된 제목과 본문 ('title', 'content', 실패 시 'error')
+        """
         try:
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 기술 블로그 작성을 도와주는 AI 어시스턴트입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.7
-            )
+            if self._async_client is None:
+                self._async_client = openai.AsyncOpenAI(api_key=self.api_key)
             
-            title = response.choices[0].message.content.strip()
-            logger.info(f"블로그 제목 생성 완료: {title}")
-            return title
+            response = await self._async_client.chat.completions.create(**self._completion_params(commit_summary))
+            return self._parse_post(response, commit_summary)
             
         except Exception as e:
-            logger.error(f"제목 생성 중 오류 발생: {e}")
-            return "오늘의 개발 일지"
+            logger.error("제목 및 본문 생성 중 오류 발생: %s", e)
+            return self._fallback_post(commit_summary, e)
     
-    def _generate_content(self, commit_summary: str) -> str:
+    def _completion_params(self, commit_summary: str) -> Dict:
         """
-        커밋 정보를 바탕으로 블로그 본문을 생성합니다
+        chat.completions 요청 파라미터를 만듭니다
         
         Args:
             commit_summary: 포맷팅된 커밋 정보
             
         Returns:
-            생성된 블로그 본문
+            요청 파라미터
         """
-        prompt = f"""
-다음 Git 커밋 정보를 바탕으로 기술 블로그 포스트를 작성해주세요.
-
-커밋 정보:
-{commit_summary}
-
-다음 형식으로 작성해주세요:
-
-## ✨ 들어가며
-오늘 어떤 기능을 개발했는지, 혹은 어떤 버그를 수정했는지 간략하게 소개하는 문단입니다.
-
-## 📝 주요 변경 사항
-- (관련 Git 커밋 해시) 변경된 핵심 로직이나 기능에 대해 서술합니다.
-- 코드 블록을 사용해 실제 코드 변경점을 보여줍니다.
-
-## 💡 구현 과정 및 배운 점
-개발 과정에서 겪었던 어려움, 해결 방법, 새롭게 알게 된 점 등을 자유롭게 서술합니다.
-
-## ✅ 마무리
-다음 계획이나 소감을 짧게 남기는 문단입니다.
-
-자연스럽고 읽기 쉬운 한국어로 작성해주세요. 기술적이면서도 친근한 톤을 유지해주세요.
-"""
+        return {
+            'model': self.model,
+            'response_format': {"type": "json_object"},
+            'messages': [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": f"커밋 정보:\n{commit_summary}"}
+            ],
+            'max_tokens': 2100,
+            'temperature': 0.8
+        }
+    
+    def _parse_post(self, response, commit_summary: str) -> Dict[str, str]:
+        """
+        JSON 형식의 LLM 응답에서 제목과 본문을 꺼냅니다
+        
+        Args:
+            response: chat.completions 응답 객체
+            commit_summary: 포맷팅된 커밋 정보 (응답을 살릴 수 없을 때 사용)
+            
+        Returns:
+            생성된 제목과 본문
+        """
+        choice = response.choices[0]
+        raw = choice.message.content or ''
+        
+        # max_tokens에서 잘린 응답은 JSON이 닫히지 않으므로 받은 텍스트라도 살립니다
+        if choice.finish_reason == 'length':
+            logger.warning("응답이 max_tokens에서 잘렸습니다")
+            return self._truncated_post(raw, choice.finish_reason, commit_summary)
         
         try:
-            client = openai.OpenAI(api_key=self.api_key)
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 경험 많은 개발자이자 기술 블로그 작가입니다. Git 커밋 정보를 바탕으로 유익하고 읽기 쉬운 기술 블로그 포스트를 작성합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.8
-            )
+            result = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.warning("JSON 응답 파싱 실패 (finish_reason=%s): %s", choice.finish_reason, e)
+            return self._truncated_post(raw, choice.finish_reason, commit_summary)
+        
+        if not isinstance(result, dict):
+            return self._truncated_post(raw, choice.finish_reason, commit_summary)
+        
+        title = (result.get('title') or '').strip() or "오늘의 개발 일지"
+        content = (result.get('content') or '').strip()
+        logger.info("블로그 제목 및 본문 생성 완료: %s", title)
+        return {'title': title, 'content': content}
+    
+    def _truncated_post(self, raw: str, finish_reason: Optional[str],
+                        commit_summary: str) -> Dict[str, str]:
+        """
+        JSON으로 파싱할 수 없는 응답에서 제목과 본문을 최대한 살려냅니다
+        
+        잘린 JSON은 문자열과 객체를 닫아서 다시 파싱해 보고, 그래도 안 되면
+        JSON 원문을 본문으로 쓰지 않고 기본 본문을 사용합니다. 불완전한 결과이므로
+        'error' 키를 붙여 캐시에 저장되지 않게 합니다.
+        
+        Args:
+            raw: LLM 응답 텍스트
+            finish_reason: 응답 종료 사유 (max_tokens에서 잘리면 'length')
+            commit_summary: 포맷팅된 커밋 정보
             
-            content = response.choices[0].message.content.strip()
-            logger.info("블로그 본문 생성 완료")
-            return content
+        Returns:
+            생성된 제목과 본문 ('error' 포함)
+        """
+        error = f"불완전한 JSON 응답 (finish_reason={finish_reason})"
+        
+        result = None
+        for suffix in ('"}', '}'):
+            try:
+                result = json.loads(raw.rstrip('\\') + suffix)
+                break
+            except json.JSONDecodeError:
+                continue
+        
+        content = (result.get('content') or '').strip() if isinstance(result, dict) else ''
+        if not content:
+            return self._fallback_post(commit_summary, ValueError(error))
+        
+        return {
+            'title': (result.get('title') or '').strip() or "오늘의 개발 일지",
+            'content': content,
+            'error': error
+        }
+    
+    def _fallback_post(self, commit_summary: str, error: Exception) -> Dict[str, str]:
+        """LLM 호출 실패 시 사용할 제목과 본문을 만듭니다"""
+        return {
+            'title': "오늘의 개발 일지",
+            'content': self._fallback_content(commit_summary),
+            'error': str(error)
+        }
+    
+    def _fallback_content(self, commit_summary: str) -> str:
+        """
+        LLM 호출에 실패했을 때 사용할 기본 본문을 만듭니다
+        
+        Args:
+            commit_summary: 포맷팅된 커밋 정보
             
-        except Exception as e:
-            logger.error(f"본문 생성 중 오류 발생: {e}")
-            return f"""
+        Returns:
+            기본 블로그 본문
+        """
+        return f"""
 ## ✨ 들어가며
 오늘 Git 커밋 정보를 분석하여 블로그 포스트를 생성하려고 했지만, 내용 생성 중 오류가 발생했습니다.
 
@@ -5,17 +5,31 @@ Git 커밋 로그를 분석하고 변경사항을 추출하는 모듈
 변경된 파일들과 커밋 메시지를 추출합니다.
 """
 
+import bisect
 import logging
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+import threading
+import time
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+from datetime import datetime
 from dataclasses import dataclass
-from git import Repo, Commit, Diff
+from git import Repo, Diff
 import os
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# `git log --pretty=format` 출력을 나누는 구분자
+_LOG_RECORD_START = '\x01'
+_LOG_FIELD_SEP = '\x1f'
+_LOG_MESSAGE_END = '\x1e'
+
+# `git log --diff-merges`를 지원하는 최소 git 버전
+_DIFF_MERGES_MIN_GIT = (2, 31)
+
+# 이보다 큰 파일의 변경사항은 분석하지 않음 (바이너리/생성 파일로 간주)
+_MAX_BLOB_SIZE = 1_000_000
+
 
 @dataclass
 class CommitInfo:
@@ -42,24 +56,36 @@ class FileChange:
 class GitAnalyzer:
     """Git 리포지토리를 분석하는 클래스"""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: Union[str, os.PathLike, Repo]):
         """
         GitAnalyzer 초기화
         
         Args:
-            repo_path: Git 리포지토리 경로
+            repo_path: Git 리포지토리 경로 또는 이미 열어 둔 Repo 객체
         """
         self.repo_path = repo_path
         self.repo = None
+        # 여러 커밋이 같은 파일 경로 문자열을 공유하도록 하는 테이블
+        self._path_intern: Dict[str, str] = {}
+        # GitPython의 객체 DB(cat-file 프로세스)는 스레드 간에 동시에 쓸 수 없음
+        self._object_lock = threading.Lock()
+        # prepare()로 미리 읽어 둔 커밋 (최신순)과 그 기간
+        self._prepared_commits: List[CommitInfo] = []
+        self._prepared_keys: List[float] = []
+        self._prepared_days = 0
         self._initialize_repo()
     
     def _initialize_repo(self) -> None:
         """Git 리포지토리 초기화"""
         try:
-            self.repo = Repo(self.repo_path)
-            logger.info(f"Git 리포지토리 초기화 완료: {self.repo_path}")
+            if isinstance(self.repo_path, Repo):
+                self.repo = self.repo_path
+                self.repo_path = self.repo.working_tree_dir or self.repo.git_dir
+            else:
+                self.repo = Repo(self.repo_path)
+            logger.info("Git 리포지토리 초기화 완료: %s", self.repo_path)
         except Exception as e:
-            logger.error(f"Git 리포지토리 초기화 실패: {e}")
+            logger.error("Git 리포지토리 초기화 실패: %s", e)
             raise
     
     def get_recent_commits(self, days: int = 7) -> List[CommitInfo]:
@@ -73,115 +99,236 @@ class GitAnalyzer:
             최근 커밋 정보 리스트
         """
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            commits = []
-            for commit in self.repo.iter_commits('main'):
-                commit_date = datetime.fromtimestamp(commit.committed_date)
-                
-                if commit_date < start_date:
-                    break
-                
-                commit_info = self._extract_commit_info(commit)
-                commits.append(commit_info)
+            if days <= self._prepared_days:
+                commits = self._slice_prepared(days)
+            else:
+                commits = list(self.iter_recent_commits(days))
             
-            logger.info(f"최근 {days}일간 {len(commits)}개의 커밋을 찾았습니다")
+            logger.info("최근 %s일간 %s개의 커밋을 찾았습니다", days, len(commits))
             return commits
             
         except Exception as e:
-            logger.error(f"커밋 조회 중 오류 발생: {e}")
+            logger.error("커밋 조회 중 오류 발생: %s", e)
             return []
     
-    def _extract_commit_info(self, commit: Commit) -> CommitInfo:
+    def prepare(self, max_days: int) -> None:
+        """
+        최근 max_days일간의 커밋을 한 번만 읽어 두고 이후 조회에 재사용합니다
+        
+        여러 기간을 연달아 조회할 때 기간마다 git log를 다시 실행하지 않고,
+        미리 읽어 둔 커밋에서 이진 탐색으로 해당 기간만 잘라 냅니다.
+        준비 이후에 생긴 커밋은 반영되지 않으므로, 작업이 끝나면 release()로 해제합니다.
+        
+        Args:
+            max_days: 미리 읽어 둘 최대 일수
+        """
+        try:
+            commits = list(self.iter_recent_commits(max_days))
+        except Exception as e:
+            # 준비에 실패하면 기간별 조회가 각자 git log를 실행하도록 비워 둠
+            logger.error("커밋 미리 읽기 중 오류 발생: %s", e)
+            self.release()
+            return
+        
+        # git log 순서는 날짜순이 보장되지 않으므로 최신순으로 정렬
+        commits.sort(key=lambda commit: commit.date, reverse=True)
+        
+        self._prepared_commits = commits
+        self._prepared_keys = [-commit.date.timestamp() for commit in commits]
+        self._prepared_days = max_days
+        logger.info("최근 %s일간 %s개의 커밋을 미리 읽었습니다", max_days, len(commits))
+    
+    def release(self) -> None:
+        """prepare()로 미리 읽어 둔 커밋을 해제해 이후 조회가 다시 git log를 실행하게 합니다"""
+        self._prepared_commits = []
+        self._prepared_keys = []
+        self._prepared_days = 0
+    
+    def _slice_prepared(self, days: int) -> List[CommitInfo]:
+        """
+        미리 읽어 둔 커밋 중 최근 N일간의 커밋을 잘라 냅니다
+        
+        Args:
+            days: 조회할 일수
+            
+        Returns:
+            최근 커밋 정보 리스트
+        """
+        cutoff = time.time() - days * 86400
+        end = bisect.bisect_right(self._prepared_keys, -cutoff)
+        return self._prepared_commits[:end]
+    
+    def iter_recent_commits(self, days: int = 7) -> Iterator[CommitInfo]:
+        """
+        최근 N일간의 커밋들을 하나씩 생성합니다
+        
+        커밋별로 diff를 계산하지 않고 `git log --numstat -z`를 한 번만 실행한 뒤
+        그 출력을 파싱합니다. 기간 필터링도 git의 --since 옵션에 맡깁니다.
+        머지 커밋의 변경사항은 첫 번째 부모 기준으로 집계합니다.
+        
+        Args:
+            days: 조회할 일수 (기본값: 7일)
+            
+        Yields:
+            커밋 정보
+        """
+        # 날짜 객체 대신 UNIX 타임스탬프로 기간을 전달 (git은 '@<초>' 형식을 그대로 해석)
+        start_ts = int(time.time()) - days * 86400
+        
+        # 브랜치 이름 대신 HEAD를 넘겨야 분리된 HEAD에서도 동작하고,
+        # 같은 이름의 파일/디렉토리가 있어도 '--'로 경로가 아님을 명시합니다
+        output = self.repo.git.log(
+            'HEAD',
+            '--since', f'@{start_ts}',
+            f'--pretty=format:{_LOG_RECORD_START}%H{_LOG_FIELD_SEP}%an{_LOG_FIELD_SEP}%ct{_LOG_FIELD_SEP}%B{_LOG_MESSAGE_END}',
+            '--numstat',
+            self._merge_diff_option(),
+            '-z',
+            '--'
+        )
+        
+        # -m을 쓰는 경우 머지 커밋이 부모 수만큼 반복되므로 첫 번째(첫 번째 부모 기준)만 사용
+        seen = set()
+        for record in output.split(_LOG_RECORD_START):
+            if not record:
+                continue
+            hexsha = record.split(_LOG_FIELD_SEP, 1)[0]
+            if hexsha in seen:
+                continue
+            seen.add(hexsha)
+            yield self._parse_log_record(record)
+    
+    def _merge_diff_option(self) -> str:
         """
-        커밋 객체에서 정보를 추출합니다
+        머지 커밋을 첫 번째 부모와 비교하도록 하는 `git log` 옵션을 고릅니다
+        
+        머지 커밋은 기본적으로 numstat이 비어 있습니다. --diff-merges는 git 2.31부터
+        지원하므로 그 이전 버전에서는 부모마다 diff를 출력하는 -m을 사용합니다.
+        
+        Returns:
+            git log 옵션
+        """
+        if self.repo.git.version_info >= _DIFF_MERGES_MIN_GIT:
+            return '--diff-merges=first-parent'
+        return '-m'
+    
+    def _parse_log_record(self, record: str) -> CommitInfo:
+        """
+        `git log --numstat -z` 출력의 커밋 하나를 파싱합니다
         
         Args:
-            commit: Git 커밋 객체
+            record: 커밋 하나에 해당하는 로그 출력
             
         Returns:
             추출된 커밋 정보
         """
-        # 변경된 파일 목록
+        header, _, numstat = record.partition(_LOG_MESSAGE_END)
+        hexsha, author, committed_date, message = header.split(_LOG_FIELD_SEP, 3)
+        
         files_changed = []
         additions = 0
         deletions = 0
         
-        if commit.parents:
-            # 부모 커밋과의 차이점 분석
-            diff = commit.diff(commit.parents[0])
-            for change in diff:
-                files_changed.append(change.a_path or change.b_path)
-                # stats가 없는 경우 0으로 처리
-                try:
-                    additions += change.stats.get('insertions', 0)
-                    deletions += change.stats.get('deletions', 0)
-                except AttributeError:
-                    # stats 속성이 없는 경우
-                    pass
-        else:
-            # 최초 커밋인 경우
-            for file_path in commit.stats.files.keys():
-                files_changed.append(file_path)
-            # stats.files.values()는 dict이므로 안전하게 처리
-            try:
-                additions = sum(commit.stats.files.values())
-            except TypeError:
-                additions = 0
+        # 각 항목은 "추가\t삭제\t경로" 형태이며, 이름이 바뀐 파일은
+        # 경로 자리가 비어 있고 이전 경로와 새 경로가 뒤따라 옵니다
+        tokens = iter(numstat.lstrip('\n').split('\0'))
+        for token in tokens:
+            if not token:
+                continue
+            
+            added, deleted, file_path = token.split('\t', 2)
+            if not file_path:
+                next(tokens, None)
+                file_path = next(tokens, '')
+            
+            files_changed.append(self.intern_path(file_path))
+            # 바이너리 파일은 라인 수 대신 '-'로 표시됩니다
+            if added != '-':
+                additions += int(added)
+            if deleted != '-':
+                deletions += int(deleted)
         
         return CommitInfo(
-            hash=commit.hexsha[:8],
-            author=commit.author.name,
-            date=datetime.fromtimestamp(commit.committed_date),
-            message=commit.message.strip(),
+            hash=hexsha[:8],
+            author=author,
+            date=datetime.fromtimestamp(int(committed_date)),
+            message=message.strip(),
             files_changed=files_changed,
             additions=additions,
             deletions=deletions
         )
     
-    def get_file_changes(self, commit_hash: str) -> List[FileChange]:
+    def intern_path(self, path: str) -> str:
+        """
+        파일 경로를 중복 없이 하나의 문자열 객체로 보관합니다
+        
+        같은 경로가 여러 커밋에 등장해도 동일한 객체를 돌려주므로
+        긴 히스토리를 분석할 때 메모리 사용량이 줄어듭니다.
+        
+        Args:
+            path: 파일 경로
+            
+        Returns:
+            공유되는 파일 경로 문자열
+        """
+        return self._path_intern.setdefault(path, path)
+    
+    def get_file_changes(self, commit_hash: str, max_diff_bytes: int = 4096,
+                         max_files: int = 50) -> List[FileChange]:
         """
         특정 커밋의 파일 변경사항을 상세히 분석합니다
         
         Args:
             commit_hash: 커밋 해시
+            max_diff_bytes: 파일별로 보관할 diff 내용의 최대 바이트 수
+            max_files: 반환할 최대 파일 수
             
         Returns:
             파일 변경 정보 리스트
         """
         try:
-            commit = self.repo.commit(commit_hash)
-            changes = []
-            
-            if commit.parents:
-                diff = commit.diff(commit.parents[0])
-                for change in diff:
-                    file_change = self._extract_file_change(change)
-                    if file_change:
-                        changes.append(file_change)
+            with self._object_lock:
+                commit = self.repo.commit(commit_hash)
+                changes = []
+                
+                if commit.parents:
+                    # 부모 → 커밋 방향으로 비교해야 추가/삭제가 뒤바뀌지 않고,
+                    # create_patch=True여야 diff 내용이 채워집니다
+                    diff = commit.parents[0].diff(commit, create_patch=True)
+                    for change in diff:
+                        if len(changes) >= max_files:
+                            break
+                        file_change = self._extract_file_change(change, max_diff_bytes)
+                        if file_change:
+                            changes.append(file_change)
             
             return changes
             
         except Exception as e:
-            logger.error(f"파일 변경사항 분석 중 오류 발생: {e}")
+            logger.error("파일 변경사항 분석 중 오류 발생: %s", e)
             return []
     
-    def _extract_file_change(self, diff: Diff) -> Optional[FileChange]:
+    def _extract_file_change(self, diff: Diff, max_diff_bytes: int = 4096) -> Optional[FileChange]:
         """
         diff 객체에서 파일 변경 정보를 추출합니다
         
         Args:
             diff: Git diff 객체
+            max_diff_bytes: 보관할 diff 내용의 최대 바이트 수
             
         Returns:
             파일 변경 정보
         """
         try:
-            file_path = diff.a_path or diff.b_path
+            file_path = diff.b_path or diff.a_path
             if not file_path:
                 return None
             
+            # 너무 큰 파일은 바이너리나 생성된 파일일 가능성이 높으므로 건너뜀
+            for blob in (diff.a_blob, diff.b_blob):
+                if blob and blob.size > _MAX_BLOB_SIZE:
+                    return None
+            
             # 변경 타입 결정
             if diff.new_file:
                 change_type = 'A'  # 추가
@@ -190,16 +337,15 @@ class GitAnalyzer:
             else:
                 change_type = 'M'  # 수정
             
-            # diff 내용 추출
-            diff_content = diff.diff.decode('utf-8', errors='ignore')
+            # diff 내용 추출 (LLM에 전달되는 분량만큼만 보관)
+            raw_diff = diff.diff or b''
+            diff_content = raw_diff[:max_diff_bytes].decode('utf-8', errors='ignore')
+            if len(raw_diff) > max_diff_bytes:
+                diff_content += "…[truncated]"
             
-            # stats 정보 추출 (안전하게)
-            try:
-                additions = diff.stats.get('insertions', 0)
-                deletions = diff.stats.get('deletions', 0)
-            except AttributeError:
-                additions = 0
-                deletions = 0
+            # 패치는 '@@' 헝크 헤더부터 시작하므로 '+'/'-'로 시작하는 줄이 곧 추가/삭제 라인
+            additions = raw_diff.count(b'\n+')
+            deletions = raw_diff.count(b'\n-')
             
             return FileChange(
                 file_path=file_path,
@@ -210,7 +356,7 @@ class GitAnalyzer:
             )
             
         except Exception as e:
-            logger.error(f"파일 변경 정보 추출 중 오류: {e}")
+            logger.error("파일 변경 정보 추출 중 오류: %s", e)
             return None
     
     def get_repo_stats(self) -> Dict[str, any]:
@@ -221,18 +367,22 @@ class GitAnalyzer:
             리포지토리 통계 정보
         """
         try:
-            stats = {
-                'total_commits': len(list(self.repo.iter_commits())),
-                'branches': [branch.name for branch in self.repo.branches],
-                'active_branch': self.repo.active_branch.name,
-                'last_commit': {
-                    'hash': self.repo.head.commit.hexsha[:8],
-                    'message': self.repo.head.commit.message.strip(),
-                    'date': datetime.fromtimestamp(self.repo.head.commit.committed_date)
+            total_commits = int(self.repo.git.rev_list('--count', 'HEAD'))
+            
+            with self._object_lock:
+                head_commit = self.repo.head.commit
+                stats = {
+                    'total_commits': total_commits,
+                    'branches': [branch.name for branch in self.repo.branches],
+                    'active_branch': self.repo.active_branch.name,
+                    'last_commit': {
+                        'hash': head_commit.hexsha[:8],
+                        'message': head_commit.message.strip(),
+                        'date': datetime.fromtimestamp(head_commit.committed_date)
+                    }
                 }
-            }
             return stats
             
         except Exception as e:
-            logger.error(f"리포지토리 통계 조회 중 오류 발생: {e}")
+            logger.error("리포지토리 통계 조회 중 오류 발생: %s", e)
             return {}
@@ -4,19 +4,22 @@
 이 스크립트는 Git 분석, 내용 생성, 포맷팅의 전체 프로세스를 조율하고 실행합니다.
 """
 
+import asyncio
 import logging
 import os
 import sys
 import argparse
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
 from datetime import datetime
 from dotenv import load_dotenv
+from git import Repo
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.git_analyzer import GitAnalyzer
-from src.content_generator import ContentGenerator
+from src.content_generator import ContentGenerator, DEFAULT_MODEL
 from src.post_formatter import PostFormatter
 
 # 환경변수 로드
@@ -33,16 +36,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 파일 변경 상세 분석을 생략하는 기준 (커밋 수가 이보다 많고, 최근 커밋의 변경 파일 수가 이 이상일 때)
+_FILE_CHANGES_MAX_COMMITS = 5
+_FILE_CHANGES_MAX_FILES = 50
+
 
 class BlogGenerator:
     """블로그 자동 생성 시스템의 메인 클래스"""
     
-    def __init__(self, repo_path: str, output_dir: str = "./output"):
+    def __init__(self, repo_path: Union[str, os.PathLike, Repo],
+                 output_dir: Union[str, os.PathLike] = "./output"):
         """
         BlogGenerator 초기화
         
         Args:
-            repo_path: 분석할 Git 리포지토리 경로
+            repo_path: 분석할 Git 리포지토리 경로 또는 이미 열어 둔 Repo 객체
             output_dir: 출력 디렉토리 경로
         """
         self.repo_path = repo_path
@@ -64,7 +72,7 @@ class BlogGenerator:
             
             # 내용 생성기 초기화
             api_key = os.getenv("OPENAI_API_KEY")
-            model = os.getenv("OPENAI_MODEL", "gpt-4")
+            model = os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
             self.content_generator = ContentGenerator(api_key, model)
             logger.info("내용 생성기 초기화 완료")
             
@@ -73,9 +81,25 @@ class BlogGenerator:
             logger.info("포스트 포맷터 초기화 완료")
             
         except Exception as e:
-            logger.error(f"컴포넌트 초기화 중 오류 발생: {e}")
+            logger.error("컴포넌트 초기화 중 오류 발생: %s", e)
             raise
     
+    def prepare(self, max_days: int) -> None:
+        """
+        최근 max_days일간의 커밋을 미리 읽어 둡니다
+        
+        이후 max_days 이하 기간의 포스트 생성은 git log를 다시 실행하지 않습니다.
+        그 사이에 생긴 커밋은 반영되지 않으므로 작업이 끝나면 release()를 호출합니다.
+        
+        Args:
+            max_days: 미리 읽어 둘 최대 일수
+        """
+        self.git_analyzer.prepare(max_days)
+    
+    def release(self) -> None:
+        """prepare()로 미리 읽어 둔 커밋을 해제합니다"""
+        self.git_analyzer.release()
+    
     def generate_blog_post(self, days: int = 7, include_file_changes: bool = True) -> Optional[str]:
         """
         블로그 포스트를 생성합니다
@@ -88,48 +112,120 @@ class BlogGenerator:
             생성된 블로그 포스트 파일 경로
         """
         try:
-            logger.info(f"블로그 포스트 생성 시작 (분석 기간: {days}일)")
+            logger.info("블로그 포스트 생성 시작 (분석 기간: %s일)", days)
             
-            # 1. Git 커밋 분석
-            commits = self.git_analyzer.get_recent_commits(days)
-            if not commits:
-                logger.warning(f"최근 {days}일간 커밋이 없습니다.")
+            # 1~2. Git 커밋 및 파일 변경 분석
+            collected = self._collect_changes(days, include_file_changes)
+            if collected is None:
                 return None
-            
-            logger.info(f"{len(commits)}개의 커밋을 분석했습니다.")
-            
-            # 2. 파일 변경 상세 정보 수집 (선택사항)
-            file_changes = []
-            if include_file_changes and commits:
-                # 가장 최근 커밋의 파일 변경사항만 분석
-                latest_commit = commits[0]
-                file_changes = self.git_analyzer.get_file_changes(latest_commit.hash)
-                logger.info(f"{len(file_changes)}개의 파일 변경사항을 분석했습니다.")
+            commits, file_changes = collected
             
             # 3. 블로그 내용 생성
             content_data = self.content_generator.generate_blog_content(commits, file_changes)
             logger.info("블로그 내용 생성 완료")
             
-            # 4. 포스트 포맷팅
-            formatted_post = self.post_formatter.format_blog_post(content_data)
-            logger.info("포스트 포맷팅 완료")
+            # 4~5. 포맷팅 및 파일 저장
+            return self._save_post(content_data, datetime.now().strftime("%Y%m%d"))
             
-            # 5. 파일 저장
-            title = content_data.get('title', '오늘의 개발 일지')
-            filename = self.post_formatter.generate_filename_from_title(title)
-            filepath = self.post_formatter.save_blog_post(formatted_post, filename)
+        except Exception as e:
+            logger.error("블로그 포스트 생성 중 오류 발생: %s", e)
+            return None
+    
+    async def _agenerate_blog_post(self, days: int, include_file_changes: bool,
+                                   date_str: str, executor: ThreadPoolExecutor) -> Optional[str]:
+        """
+        generate_blog_post의 비동기 버전입니다
+        
+        Args:
+            days: 분석할 커밋의 기간 (일)
+            include_file_changes: 파일 변경 상세 정보 포함 여부
+            date_str: 파일명에 붙일 날짜 (YYYYMMDD)
+            executor: Git 분석을 실행할 스레드 풀
+            
+        Returns:
+            생성된 블로그 포스트 파일 경로
+        """
+        try:
+            logger.info("%s일간의 블로그 포스트 생성 시작", days)
             
-            logger.info(f"블로그 포스트 생성 완료: {filepath}")
-            return filepath
+            # Git 분석은 subprocess 대기 중 GIL을 놓으므로 스레드 풀에서 기간별로 동시에 실행
+            loop = asyncio.get_running_loop()
+            collected = await loop.run_in_executor(
+                executor, self._collect_changes, days, include_file_changes
+            )
+            if collected is None:
+                return None
+            commits, file_changes = collected
+            
+            content_data = await self.content_generator.agenerate_blog_content(commits, file_changes)
+            logger.info("블로그 내용 생성 완료")
+            
+            return self._save_post(content_data, date_str)
             
         except Exception as e:
-            logger.error(f"블로그 포스트 생성 중 오류 발생: {e}")
+            logger.error("블로그 포스트 생성 중 오류 발생: %s", e)
             return None
     
+    def _collect_changes(self, days: int, include_file_changes: bool) -> Optional[tuple]:
+        """
+        분석 기간의 커밋과 파일 변경 정보를 수집합니다
+        
+        Args:
+            days: 분석할 커밋의 기간 (일)
+            include_file_changes: 파일 변경 상세 정보 포함 여부
+            
+        Returns:
+            (커밋 리스트, 파일 변경 리스트) 튜플 (커밋이 없는 경우 None)
+        """
+        # 1. Git 커밋 분석
+        commits = self.git_analyzer.get_recent_commits(days)
+        if not commits:
+            logger.warning("최근 %s일간 커밋이 없습니다.", days)
+            return None
+        
+        logger.info("%s개의 커밋을 분석했습니다.", len(commits))
+        
+        # 2. 파일 변경 상세 정보 수집 (선택사항)
+        file_changes = []
+        latest_commit = commits[0]
+        # 커밋이 많고 최근 커밋이 너무 많은 파일을 건드렸다면 어차피 LLM 입력에서 잘리므로 생략
+        if include_file_changes and (len(commits) <= _FILE_CHANGES_MAX_COMMITS
+                                     or len(latest_commit.files_changed) < _FILE_CHANGES_MAX_FILES):
+            # 가장 최근 커밋의 파일 변경사항만 분석
+            file_changes = self.git_analyzer.get_file_changes(latest_commit.hash)
+            logger.info("%s개의 파일 변경사항을 분석했습니다.", len(file_changes))
+        
+        return commits, file_changes
+    
+    def _save_post(self, content_data: dict, date_str: str) -> str:
+        """
+        생성된 내용을 포맷팅하여 파일로 저장합니다
+        
+        Args:
+            content_data: ContentGenerator에서 생성된 내용 데이터
+            date_str: 파일명에 붙일 날짜 (YYYYMMDD)
+            
+        Returns:
+            저장된 블로그 포스트 파일 경로
+        """
+        # 4. 포스트 포맷팅
+        formatted_post = self.post_formatter.format_blog_post(content_data)
+        logger.info("포스트 포맷팅 완료")
+        
+        # 5. 파일 저장
+        title = content_data.get('title', '오늘의 개발 일지')
+        filename = self.post_formatter.generate_filename_from_title(title, date_str)
+        filepath = self.post_formatter.save_blog_post(formatted_post, filename)
+        
+        logger.info("블로그 포스트 생성 완료: %s", filepath)
+        return filepath
+    
     def generate_multiple_posts(self, days_list: list, include_file_changes: bool = True) -> list:
         """
         여러 기간의 블로그 포스트를 생성합니다
         
+        기간별 LLM 요청은 서로 독립적이므로 asyncio.gather로 동시에 보냅니다.
+        
         Args:
             days_list: 분석할 기간 리스트 (예: [1, 7, 30])
             include_file_changes: 파일 변경 상세 정보 포함 여부
@@ -137,13 +233,15 @@ class BlogGenerator:
         Returns:
             생성된 포스트 파일 경로 리스트
         """
-        generated_posts = []
-        
-        for days in days_list:
-            logger.info(f"{days}일간의 블로그 포스트 생성 시작")
-            filepath = self.generate_blog_post(days, include_file_changes)
-            if filepath:
-                generated_posts.append(filepath)
+        # 가장 긴 기간의 커밋을 한 번만 읽고 나머지 기간은 그 안에서 잘라 씀
+        # (이후 단일 포스트 생성이 오래된 스냅샷을 쓰지 않도록 끝나면 해제)
+        if days_list:
+            self.prepare(max(days_list))
+        try:
+            results = asyncio.run(self._agenerate_multiple_posts(days_list, include_file_changes))
+        finally:
+            self.release()
+        generated_posts = [filepath for filepath in results if filepath]
         
         # 요약 파일 생성
         if generated_posts:
@@ -151,6 +249,29 @@ class BlogGenerator:
         
         return generated_posts
     
+    async def _agenerate_multiple_posts(self, days_list: list, include_file_changes: bool) -> list:
+        """
+        기간별 블로그 포스트를 동시에 생성합니다
+        
+        Args:
+            days_list: 분석할 기간 리스트
+            include_file_changes: 파일 변경 상세 정보 포함 여부
+            
+        Returns:
+            기간별 포스트 파일 경로 리스트 (실패한 기간은 None)
+        """
+        try:
+            # 같은 배치의 포스트는 모두 같은 날짜를 사용
+            date_str = datetime.now().strftime("%Y%m%d")
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                tasks = [
+                    self._agenerate_blog_post(days, include_file_changes, date_str, executor)
+                    for days in days_list
+                ]
+                return await asyncio.gather(*tasks)
+        finally:
+            await self.content_generator.aclose()
+    
     def get_repo_stats(self) -> dict:
         """
         리포지토리 통계 정보를 반환합니다
@@ -202,7 +323,7 @@ def main():
             print("로그 파일을 확인해주세요: blog_generator.log")
     
     except Exception as e:
-        logger.error(f"실행 중 오류 발생: {e}")
+        logger.error("실행 중 오류 발생: %s", e)
         print(f"\n❌ 오류가 발생했습니다: {e}")
         print("로그 파일을 확인해주세요: blog_generator.log")
         sys.exit(1)
@@ -5,9 +5,11 @@
 Rule에 정의된 형식에 맞는 완성된 Markdown 블로그 포스트로 변환합니다.
 """
 
+import functools
+import io
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from datetime import datetime
 import re
 
@@ -15,11 +17,40 @@ import re
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 포맷팅에 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+_LEADING_H1_RE = re.compile(r'^#\s+.*?\n')
+_INLINE_RE = re.compile(
+    r'(?P<code>`[^`]*`)'
+    r'|\((?P<hash>[a-f0-9]{8})\)'
+    r'|https://github\.com/(?P<owner>[^/\s]+)/(?P<repo>[^/\s]+)'
+    # 파일 경로 앞뒤 경계는 ASCII 문자로만 판단해야 'main.py를'처럼 조사가 붙은 경로도 감쌉니다.
+    # 'Node.js', 'Vue.js'처럼 대문자로 시작하는 .js/.ts 이름은 경로가 아닌 프레임워크명으로 봅니다.
+    r'|(?<![A-Za-z0-9_./:(-])(?![A-Z][A-Za-z0-9]*\.(?:js|ts)(?![A-Za-z0-9_./-]))'
+    r'(?P<path>[A-Za-z0-9_./-]+\.(?:py|js|ts|java|cpp|h|md|txt))(?![A-Za-z0-9_/-])'
+)
+_SPECIAL_RE = re.compile(r'[^\w\s-]')
+_DASH_SPACE_RE = re.compile(r'[-\s]+')
+
+
+def _replace_inline(match: re.Match) -> str:
+    """본문 한 줄 안의 커밋 해시, GitHub 링크, 파일 경로를 치환합니다"""
+    if match.group('code'):
+        # 이미 인라인 코드인 부분은 그대로 둠
+        return match.group('code')
+    if match.group('hash'):
+        # Git 커밋 해시를 코드 블록으로 감싸기
+        return f"(`{match.group('hash')}`)"
+    if match.group('path'):
+        # 파일 경로를 코드 블록으로 감싸기
+        return f"`{match.group('path')}`"
+    # GitHub 링크 패턴 감지 및 개선
+    return f"[GitHub 저장소](https://github.com/{match.group('owner')}/{match.group('repo')})"
+
 
 class PostFormatter:
     """블로그 포스트를 Markdown 형식으로 포맷팅하는 클래스"""
     
-    def __init__(self, output_dir: str = "./output"):
+    def __init__(self, output_dir: Union[str, os.PathLike] = "./output"):
         """
         PostFormatter 초기화
         
@@ -33,7 +64,7 @@ class PostFormatter:
         """출력 디렉토리가 존재하는지 확인하고 없으면 생성"""
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
-            logger.info(f"출력 디렉토리 생성: {self.output_dir}")
+            logger.info("출력 디렉토리 생성: %s", self.output_dir)
     
     def format_blog_post(self, content_data: Dict[str, str], 
                         include_metadata: bool = True) -> str:
@@ -67,7 +98,7 @@ class PostFormatter:
             return final_post
             
         except Exception as e:
-            logger.error(f"포스트 포맷팅 중 오류 발생: {e}")
+            logger.error("포스트 포맷팅 중 오류 발생: %s", e)
             return f"# 오늘의 개발 일지\n\n포스트 포맷팅 중 오류가 발생했습니다: {str(e)}"
     
     def _generate_metadata(self, title: str, generated_at: str) -> str:
@@ -107,77 +138,36 @@ generated_at: {generated_at}
             포맷팅된 내용
         """
         # 제목이 이미 포함되어 있다면 제거
-        content = re.sub(r'^#\s+.*?\n', '', content, count=1)
-        
-        # 코드 블록 포맷팅 개선
-        content = self._improve_code_blocks(content)
-        
-        # 링크 포맷팅 개선
-        content = self._improve_links(content)
-        
-        # 리스트 포맷팅 개선
-        content = self._improve_lists(content)
-        
-        return content
-    
-    def _improve_code_blocks(self, content: str) -> str:
-        """
-        코드 블록의 포맷팅을 개선합니다
-        
-        Args:
-            content: 원본 내용
-            
-        Returns:
-            개선된 내용
-        """
-        # Git 커밋 해시를 코드 블록으로 감싸기
-        content = re.sub(r'\(([a-f0-9]{8})\)', r'(`\1`)', content)
+        content = _LEADING_H1_RE.sub('', content, count=1)
         
-        # 파일 경로를 코드 블록으로 감싸기
-        content = re.sub(r'`([^`]+\.(py|js|ts|java|cpp|h|md|txt))`', r'`\1`', content)
-        
-        return content
-    
-    def _improve_links(self, content: str) -> str:
-        """
-        링크 포맷팅을 개선합니다
+        # 커밋 해시/GitHub 링크/파일 경로 치환과 리스트 간격 조정을 한 번의 순회로 처리
+        reader = io.StringIO(content)
+        buf = io.StringIO()
+        in_code_block = False
         
-        Args:
-            content: 원본 내용
+        # 줄 목록을 따로 만들지 않고 다음 줄 하나만 미리 읽어 가며 처리
+        line = reader.readline()
+        while line:
+            next_line = reader.readline()
             
-        Returns:
-            개선된 내용
-        """
-        # GitHub 링크 패턴 감지 및 개선
-        github_pattern = r'https://github\.com/([^/\s]+)/([^/\s]+)'
-        content = re.sub(github_pattern, r'[GitHub 저장소](https://github.com/\1/\2)', content)
-        
-        return content
-    
-    def _improve_lists(self, content: str) -> str:
-        """
-        리스트 포맷팅을 개선합니다
-        
-        Args:
-            content: 원본 내용
+            # 코드 블록 안의 내용은 치환하지 않음
+            if line.lstrip().startswith('```'):
+                in_code_block = not in_code_block
+                buf.write(line)
+            elif in_code_block:
+                buf.write(line)
+            else:
+                buf.write(_INLINE_RE.sub(_replace_inline, line))
             
-        Returns:
-            개선된 내용
-        """
-        # 리스트 항목 간격 조정
-        lines = content.split('\n')
-        improved_lines = []
-        
-        for i, line in enumerate(lines):
-            improved_lines.append(line)
+            # 리스트 항목 다음에 빈 줄 추가 (코드 블록 안의 diff 줄 등은 제외)
+            if not in_code_block and line.strip().startswith('- '):
+                stripped_next = next_line.strip()
+                if stripped_next and not stripped_next.startswith('- '):
+                    buf.write('\n')
             
-            # 리스트 항목 다음에 빈 줄 추가
-            if line.strip().startswith('- ') and i < len(lines) - 1:
-                next_line = lines[i + 1].strip()
-                if next_line and not next_line.startswith('- '):
-                    improved_lines.append('')
+            line = next_line
         
-        return '\n'.join(improved_lines)
+        return buf.getvalue()
     
     def save_blog_post(self, content: str, filename: Optional[str] = None) -> str:
         """
@@ -200,67 +190,82 @@ generated_at: {generated_at}
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(content)
             
-            logger.info(f"블로그 포스트 저장 완료: {filepath}")
+            logger.info("블로그 포스트 저장 완료: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"파일 저장 중 오류 발생: {e}")
+            logger.error("파일 저장 중 오류 발생: %s", e)
             raise
     
-    def generate_filename_from_title(self, title: str) -> str:
+    def generate_filename_from_title(self, title: str, date_str: Optional[str] = None) -> str:
         """
         제목을 바탕으로 파일명을 생성합니다
         
         Args:
             title: 블로그 제목
+            date_str: 파일명 앞에 붙일 날짜 (YYYYMMDD, None인 경우 오늘 날짜)
             
         Returns:
             생성된 파일명
         """
-        # 특수문자 제거 및 공백을 언더스코어로 변경
-        filename = re.sub(r'[^\w\s-]', '', title)
-        filename = re.sub(r'[-\s]+', '_', filename)
-        filename = filename.lower().strip('_')
+        if date_str is None:
+            date_str = datetime.now().strftime("%Y%m%d")
         
-        # 날짜 추가
-        date_str = datetime.now().strftime("%Y%m%d")
-        filename = f"{date_str}_{filename}.md"
+        return f"{date_str}_{self.slugify_title(title)}.md"
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def slugify_title(title: str) -> str:
+        """
+        제목을 파일명에 쓸 수 있는 형태로 변환합니다
         
-        return filename
+        Args:
+            title: 블로그 제목
+            
+        Returns:
+            변환된 문자열
+        """
+        # 특수문자 제거 및 공백을 언더스코어로 변경
+        filename = _SPECIAL_RE.sub('', title)
+        filename = _DASH_SPACE_RE.sub('_', filename)
+        return filename.lower().strip('_')
     
     def create_summary_file(self, posts: list) -> str:
         """
         여러 블로그 포스트의 요약 파일을 생성합니다
         
         Args:
-            posts: 블로그 포스트 정보 리스트
+            posts: 블로그 포스트 정보 리스트 (정보 dict 또는 파일 경로)
             
         Returns:
             생성된 요약 파일 경로
         """
         try:
-            summary_content = "# 블로그 포스트 목록\n\n"
-            summary_content += f"생성일: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            
-            for i, post in enumerate(posts, 1):
-                title = post.get('title', f'포스트 {i}')
-                filename = post.get('filename', f'post_{i}.md')
-                generated_at = post.get('generated_at', '')
-                
-                summary_content += f"## {i}. {title}\n"
-                summary_content += f"- 파일: `{filename}`\n"
-                if generated_at:
-                    summary_content += f"- 생성시간: {generated_at}\n"
-                summary_content += "\n"
-            
             summary_filepath = os.path.join(self.output_dir, "posts_summary.md")
             
-            with open(summary_filepath, 'w', encoding='utf-8') as f:
-                f.write(summary_content)
+            # 문자열을 계속 이어 붙이지 않고 파일에 바로 기록
+            with open(summary_filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write("# 블로그 포스트 목록\n\n")
+                f.write(f"생성일: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                
+                for i, post in enumerate(posts, 1):
+                    # generate_multiple_posts는 파일 경로 리스트를 넘겨줌
+                    if isinstance(post, str):
+                        post = {'filename': os.path.basename(post)}
+                    
+                    title = post.get('title', f'포스트 {i}')
+                    filename = post.get('filename', f'post_{i}.md')
+                    generated_at = post.get('generated_at', '')
+                    
+                    f.write(f"## {i}. {title}\n")
+                    f.write(f"- 파일: `{filename}`\n")
+                    if generated_at:
+                        f.write(f"- 생성시간: {generated_at}\n")
+                    f.write("\n")
             
-            logger.info(f"요약 파일 생성 완료: {summary_filepath}")
+            logger.info("요약 파일 생성 완료: %s", summary_filepath)
             return summary_filepath
             
         except Exception as e:
-            logger.error(f"요약 파일 생성 중 오류 발생: {e}")
+            logger.error("요약 파일 생성 중 오류 발생: %s", e)
             raise
@@ -0,0 +1,125 @@
+"""
+GitAnalyzer의 `git log --numstat -z` 파싱 테스트
+
+임시 리포지토리에 여러 줄 메시지, 이름 변경, 바이너리 파일, 머지 커밋을 만든 뒤
+iter_recent_commits 결과를 확인합니다.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git import Git
+
+from src.git_analyzer import GitAnalyzer
+
+
+class GitLogParsingTest(unittest.TestCase):
+    """iter_recent_commits의 로그 파싱 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.repo_path = self._tmp.name
+        self._git('init', '-q', '-b', 'main')
+        self._git('config', 'user.name', 'Tester')
+        self._git('config', 'user.email', 'tester@example.com')
+
+        # 1) 여러 줄 메시지를 가진 일반 커밋
+        self._write('a.txt', 'one\ntwo\nthree\n')
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'feat: add a\n\n본문 첫 줄\n본문 둘째 줄')
+
+        # 2) 이름 변경
+        self._git('mv', 'a.txt', 'b.txt')
+        self._git('commit', '-q', '-m', 'refactor: rename a to b')
+
+        # 3) 바이너리 파일
+        with open(os.path.join(self.repo_path, 'image.bin'), 'wb') as f:
+            f.write(b'\x00\x01\x02\xff' * 16)
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'chore: add binary')
+
+        # 4) 머지 커밋 (첫 번째 부모 기준으로 d.txt 한 줄 추가)
+        self._git('checkout', '-q', '-b', 'feature')
+        self._write('d.txt', 'feature\n')
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'feat: add d')
+        self._git('checkout', '-q', 'main')
+        self._write('c.txt', 'main\n')
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'fix: add c')
+        self._git('merge', '-q', '--no-ff', '-m', 'Merge branch feature', 'feature')
+
+        self.analyzer = GitAnalyzer(self.repo_path)
+        self.commits = {commit.message.splitlines()[0]: commit
+                        for commit in self.analyzer.iter_recent_commits(days=1)}
+
+    def tearDown(self):
+        self.analyzer.repo.close()
+        self._tmp.cleanup()
+
+    def _git(self, *args):
+        subprocess.run(['git', *args], cwd=self.repo_path, check=True)
+
+    def _write(self, name, text):
+        with open(os.path.join(self.repo_path, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_all_commits_parsed(self):
+        self.assertEqual(len(self.commits), 6)
+        for commit in self.commits.values():
+            self.assertEqual(commit.author, 'Tester')
+            self.assertEqual(len(commit.hash), 8)
+
+    def test_multiline_message(self):
+        commit = self.commits['feat: add a']
+        self.assertEqual(commit.message, 'feat: add a\n\n본문 첫 줄\n본문 둘째 줄')
+        self.assertEqual(commit.files_changed, ['a.txt'])
+        self.assertEqual((commit.additions, commit.deletions), (3, 0))
+
+    def test_rename(self):
+        commit = self.commits['refactor: rename a to b']
+        self.assertEqual(commit.files_changed, ['b.txt'])
+        self.assertEqual((commit.additions, commit.deletions), (0, 0))
+
+    def test_binary_file(self):
+        commit = self.commits['chore: add binary']
+        self.assertEqual(commit.files_changed, ['image.bin'])
+        self.assertEqual((commit.additions, commit.deletions), (0, 0))
+
+    def test_merge_commit_uses_first_parent(self):
+        commit = self.commits['Merge branch feature']
+        self.assertEqual(commit.files_changed, ['d.txt'])
+        self.assertEqual((commit.additions, commit.deletions), (1, 0))
+
+    def test_merge_commit_on_old_git(self):
+        # --diff-merges가 없는 git에서는 -m 출력 중 첫 번째 부모 기준 레코드만 사용
+        with mock.patch.object(Git, 'version_info', new=(2, 30, 0)):
+            commits = list(self.analyzer.iter_recent_commits(days=1))
+        self.assertEqual(len(commits), 6)
+        merge = next(commit for commit in commits if commit.message == 'Merge branch feature')
+        self.assertEqual(merge.files_changed, ['d.txt'])
+        self.assertEqual((merge.additions, merge.deletions), (1, 0))
+
+
+    def test_file_changes_from_patch(self):
+        changes = self.analyzer.get_file_changes(self.commits['fix: add c'].hash)
+        self.assertEqual(len(changes), 1)
+        change = changes[0]
+        self.assertEqual((change.file_path, change.change_type), ('c.txt', 'A'))
+        self.assertEqual((change.additions, change.deletions), (1, 0))
+        self.assertIn('+main', change.diff_content)
+
+    def test_file_changes_truncated(self):
+        changes = self.analyzer.get_file_changes(self.commits['feat: add d'].hash, max_diff_bytes=5)
+        self.assertTrue(changes[0].diff_content.endswith('…[truncated]'))
+        self.assertEqual((changes[0].additions, changes[0].deletions), (1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
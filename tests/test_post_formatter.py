@@ -0,0 +1,71 @@
+"""
+PostFormatter._format_content 테스트
+
+코드 블록, 인라인 코드, 커밋 해시, 조사가 붙은 파일 경로, 리스트 간격 처리를 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.post_formatter import PostFormatter
+
+
+class FormatContentTest(unittest.TestCase):
+    """_format_content의 본문 치환 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.formatter = PostFormatter(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _format(self, content):
+        return self.formatter._format_content(content)
+
+    def test_leading_h1_removed(self):
+        self.assertEqual(self._format("# 제목\n본문\n"), "본문\n")
+
+    def test_code_fence_untouched(self):
+        content = "```diff\n- old.py\n+ new.py (1a2b3c4d)\n```\n"
+        self.assertEqual(self._format(content), content)
+
+    def test_inline_code_untouched(self):
+        self.assertEqual(self._format("`src/main.py` 수정\n"), "`src/main.py` 수정\n")
+
+    def test_commit_hash(self):
+        self.assertEqual(self._format("- (1a2b3c4d) 버그 수정\n"), "- (`1a2b3c4d`) 버그 수정\n")
+
+    def test_github_link(self):
+        self.assertEqual(
+            self._format("https://github.com/owner/repo 참고\n"),
+            "[GitHub 저장소](https://github.com/owner/repo) 참고\n"
+        )
+
+    def test_path_with_korean_particle(self):
+        self.assertEqual(
+            self._format("src/main.py를 고치고 main.py에서 호출합니다.\n"),
+            "`src/main.py`를 고치고 `main.py`에서 호출합니다.\n"
+        )
+
+    def test_framework_names_not_wrapped(self):
+        self.assertEqual(self._format("Node.js와 Vue.js\n"), "Node.js와 Vue.js\n")
+        self.assertEqual(self._format("src/App.ts, index.js\n"), "`src/App.ts`, `index.js`\n")
+
+    def test_path_inside_url_not_wrapped(self):
+        content = "[문서](https://example.com/docs/guide.md)\n"
+        self.assertEqual(self._format(content), content)
+
+    def test_blank_line_after_list(self):
+        self.assertEqual(
+            self._format("- 항목 하나\n- 항목 둘\n다음 문단\n"),
+            "- 항목 하나\n- 항목 둘\n\n다음 문단\n"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()